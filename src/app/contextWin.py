@@ -234,13 +234,19 @@ def set_item_version(tk_img: TKImages) -> None:
             func()
 
 
-def set_version_combobox(box: ttk.Combobox, item: UI.Item) -> list[str]:
+def set_version_combobox(
+    box: ttk.Combobox, item: UI.Item,
+    versions: tuple[list[str], list[str]] | None = None,
+) -> list[str]:
     """Set values on the variant combobox.
 
     This is in a function so itemconfig can reuse it.
     It returns a list of IDs in the same order as the names.
+    If the result of item.get_version_names() is already known, it can be passed in.
     """
-    ver_lookup, version_names = item.get_version_names()
+    if versions is None:
+        versions = item.get_version_names()
+    ver_lookup, version_names = versions
     if len(version_names) <= 1:
         # There aren't any alternates to choose from, disable the box
         box.state(['disabled'])
@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing_extensions import Final, Generic, TypeVar
 from collections.abc import Sequence, Iterator
+import functools
 import itertools
 import random
 
@@ -15,7 +16,7 @@ from app import DEV_MODE, EdgeTrigger, img, tkMarkdown
 from config.corridors import UIState, Config, Options
 from corridor import GameMode, Direction, Orient, Option
 from packages import corridor
-from transtoken import TransToken
+from transtoken import CURRENT_LANG, TransToken
 import utils
 import config
 import packages
@@ -30,18 +31,24 @@ IMG_ARROW_LEFT: Final = img.Handle.builtin('BEE2/switcher_arrow', 17, 64)
 IMG_ARROW_RIGHT: Final = IMG_ARROW_LEFT.crop(transpose=img.FLIP_LEFT_RIGHT)
 
 
-# If no groups are defined for a style, use this.
-FALLBACK = corridor.CorridorGroup(
-    id='<Fallback>',
-    corridors={
-        (mode, direction, orient): []
-        for mode in GameMode
-        for direction in Direction
-        for orient in Orient
-    },
-)
-FALLBACK.pak_id = utils.special_id('<FALLBACK>')
-FALLBACK.pak_name = '???'
+@functools.lru_cache(maxsize=None)
+def _get_fallback() -> corridor.CorridorGroup:
+    """If no groups are defined for a style, use this.
+
+    This is built on first use, since it's usually not required.
+    """
+    fallback = corridor.CorridorGroup(
+        id='<Fallback>',
+        corridors={
+            (mode, direction, orient): []
+            for mode in GameMode
+            for direction in Direction
+            for orient in Orient
+        },
+    )
+    fallback.pak_id = utils.special_id('<FALLBACK>')
+    fallback.pak_name = '???'
+    return fallback
 
 TRANS_AUTHORS = TransToken.ui_plural('Author: {authors}', 'Authors: {authors}')
 TRANS_NO_AUTHORS = TransToken.ui('Authors: Unknown')
@@ -121,11 +128,22 @@ class Selector(Generic[IconT, OptionRowT]):
     icons: list[IconT]
     # The corresponding items for each slot.
     corr_list: list[corridor.CorridorUI]
+    # The icon which currently has a highlight applied, if any.
+    _highlighted_icon: IconT | None
 
     # The current corridor group for the selected style, and the config ID to save/load.
     # These are updated by load_corridors().
     corr_group: corridor.CorridorGroup
     conf_id: str
+    # Set if corr_group is the fallback, so that doesn't need to be built to check.
+    _is_fallback: bool
+    # Config IDs we already warned about unknown instances for, since these are kept.
+    _warned_unknown: set[str]
+
+    # Cached author tokens and dev-mode descriptions for each corridor, reset when the group
+    # or language changes. CorridorUI is not hashable, so these are keyed by ID - the group keeps them alive.
+    _authors_cache: dict[int, TransToken]
+    _desc_cache: dict[int, tkMarkdown.MarkdownData]
 
     # The rows created for options. These are hidden if no longer used.
     option_rows: list[OptionRowT]
@@ -142,7 +160,12 @@ class Selector(Generic[IconT, OptionRowT]):
         self.cur_images = None
         self.icons = []
         self.corr_list = []
+        self._highlighted_icon = None
         self.option_rows = []
+        self._is_fallback = False
+        self._warned_unknown = set()
+        self._authors_cache = {}
+        self._desc_cache = {}
         self.state_orient = AsyncValue(conf.last_orient)
         self.state_dir = AsyncValue(conf.last_direction)
         self.state_mode = AsyncValue(conf.last_mode)
@@ -157,6 +180,7 @@ class Selector(Generic[IconT, OptionRowT]):
             nursery.start_soon(self._display_task)
             nursery.start_soon(self._save_config_task)
             nursery.start_soon(self._mode_switch_task)
+            nursery.start_soon(self._lang_task)
             nursery.start_soon(self.ui_task)
 
     async def _window_task(self) -> None:
@@ -191,6 +215,13 @@ class Selector(Generic[IconT, OptionRowT]):
             self.store_conf()
             await self.refresh()
 
+    async def _lang_task(self) -> None:
+        """The dev-mode descriptions include translated text, so discard them when the language changes."""
+        while True:
+            await CURRENT_LANG.wait_transition()
+            self._authors_cache.clear()
+            self._desc_cache.clear()
+
     def prevent_deselection(self) -> None:
         """Ensure at least one widget is selected."""
         icons = list(self.visible_icons())
@@ -225,9 +256,9 @@ class Selector(Generic[IconT, OptionRowT]):
         # Start with the existing config, so we preserve unknown instances.
         enabled = dict(cur_conf.enabled)
 
-        for icon, corr in itertools.zip_longest(self.icons, self.corr_list):
-            if icon is not None and corr is not None:
-                enabled[corr.instance.casefold()] = icon.selected
+        # refresh() always creates enough icons, any extras are unused.
+        for icon, corr in zip(self.icons, self.corr_list):
+            enabled[corr.instance_fold] = icon.selected
 
         config.APP.store_conf(Config(enabled), self.conf_id)
 
@@ -237,7 +268,12 @@ class Selector(Generic[IconT, OptionRowT]):
             self.corr_group = packset.obj_by_id(corridor.CorridorGroup, style_id)
         except KeyError:
             LOGGER.warning('No corridors defined for style "{}"', style_id)
-            self.corr_group = FALLBACK
+            self.corr_group = _get_fallback()
+            self._is_fallback = True
+        else:
+            self._is_fallback = False
+        self._authors_cache = {}
+        self._desc_cache = {}
         self.conf_id = Config.get_id(
             style_id,
             self.state_mode.value, self.state_dir.value, self.state_orient.value,
@@ -251,8 +287,9 @@ class Selector(Generic[IconT, OptionRowT]):
         self.conf_id = Config.get_id(self.corr_group.id, mode, direction, orient)
         conf = config.APP.get_cur_conf(Config, self.conf_id, Config())
 
-        config.APP.store_conf(UIState(mode, direction, orient, *self.ui_win_getsize()))
+        self._store_ui_state()
 
+        old_count = len(self.corr_list)
         try:
             self.corr_list = self.corr_group.corridors[mode, direction, orient]
         except KeyError:
@@ -264,28 +301,44 @@ class Selector(Generic[IconT, OptionRowT]):
                 )
             self.corr_list = []
 
-        inst_enabled: dict[str, bool] = {corr.instance.casefold(): False for corr in self.corr_list}
+        inst_enabled: dict[str, bool] = dict.fromkeys(
+            (corr.instance_fold for corr in self.corr_list),
+            False,
+        )
         if conf.enabled:
+            unknown: list[str] = []
             for sel_id, enabled in conf.enabled.items():
-                try:
-                    inst_enabled[sel_id.casefold()] = enabled
-                except KeyError:
-                    LOGGER.warning('Unknown corridor instance "{}" in config!', sel_id)
+                sel_fold = sel_id.casefold()
+                if sel_fold in inst_enabled:
+                    inst_enabled[sel_fold] = enabled
+                else:
+                    unknown.append(sel_id)
+            # store_conf() preserves these, so only warn the first time.
+            if unknown and self.conf_id not in self._warned_unknown:
+                self._warned_unknown.add(self.conf_id)
+                LOGGER.warning('Unknown corridor instances in config "{}": {}', self.conf_id, unknown)
         else:
             # No configuration, populate with the defaults.
             for corr in self.corr_group.defaults(mode, direction, orient):
-                inst_enabled[corr.instance.casefold()] = True
+                inst_enabled[corr.instance_fold] = True
 
         # Create enough icons for the current corridor list.
         for _ in range(len(self.corr_list) - len(self.icons)):
             self.ui_icon_create()
 
-        for icon, corr in itertools.zip_longest(self.icons, self.corr_list):
+        if self._highlighted_icon is not None:
+            self._highlighted_icon.set_highlight(False)
+            self._highlighted_icon = None
+
+        # Icons past both the old and new lists are unused, and so were already reset.
+        for icon, corr in itertools.zip_longest(
+            itertools.islice(self.icons, max(old_count, len(self.corr_list))),
+            self.corr_list,
+        ):
             assert icon is not None
-            icon.set_highlight(False)
             if corr is not None:
-                self.ui_icon_set_img(icon, corr.icon)
-                icon.selected = inst_enabled[corr.instance.casefold()]
+                # Images are applied when reflowing, once we know which are visible.
+                icon.selected = inst_enabled[corr.instance_fold]
             else:
                 self.ui_icon_set_img(icon, None)
                 icon.selected = False
@@ -298,15 +351,22 @@ class Selector(Generic[IconT, OptionRowT]):
         # Reposition everything.
         await self.ui_win_reflow()
 
-    async def evt_resized(self) -> None:
-        """When the window is resized, save configuration."""
+    def _store_ui_state(self) -> None:
+        """Save the current window state, if it has changed."""
         width, height = self.ui_win_getsize()
-        config.APP.store_conf(UIState(
+        state = UIState(
             self.state_mode.value,
             self.state_dir.value,
             self.state_orient.value,
             width, height,
-        ))
+        )
+        # Refreshing and resizing often store the same state, skip if so.
+        if config.APP.get_cur_conf(UIState, default=UIState()) != state:
+            config.APP.store_conf(state)
+
+    async def evt_resized(self) -> None:
+        """When the window is resized, save configuration."""
+        self._store_ui_state()
         await self.ui_win_reflow()
 
     def evt_hover_enter(self, index: int) -> None:
@@ -341,11 +401,11 @@ class Selector(Generic[IconT, OptionRowT]):
                 icon.selected = True
             self.prevent_deselection()
         else:
-            if self.sticky_corr is not None:
-                # Clear the old one.
-                for other_icon in self.icons:
-                    other_icon.set_highlight(False)
+            # Clear the old one.
+            if self._highlighted_icon is not None and self._highlighted_icon is not icon:
+                self._highlighted_icon.set_highlight(False)
             icon.set_highlight(True)
+            self._highlighted_icon = icon
             self.sticky_corr = corr
             self.displayed_corr.value = corr
 
@@ -367,18 +427,24 @@ class Selector(Generic[IconT, OptionRowT]):
             return new is not corr
 
         while True:
-            if corr is not None and self.corr_group is not FALLBACK:
+            if corr is not None and not self._is_fallback:
                 self.img_ind = 0
                 self.cur_images = corr.images
                 self._sel_img(0)  # Updates the buttons.
 
-                if len(corr.authors) == 0:
-                    author = TRANS_NO_AUTHORS
-                else:
-                    author = TRANS_AUTHORS.format(
-                        authors=TransToken.list_and(corr.authors),
-                        n=len(corr.authors),
-                    )
+                try:
+                    author = self._authors_cache[id(corr)]
+                except KeyError:
+                    authors = corr.authors
+                    author_count = len(authors)
+                    if author_count == 0:
+                        author = TRANS_NO_AUTHORS
+                    else:
+                        author = TRANS_AUTHORS.format(
+                            authors=TransToken.list_and(authors),
+                            n=author_count,
+                        )
+                    self._authors_cache[id(corr)] = author
 
                 # Figure out which options to show.
                 mode = self.state_mode.value
@@ -386,20 +452,20 @@ class Selector(Generic[IconT, OptionRowT]):
                 options = list(self.corr_group.get_options(mode, direction, corr))
 
                 if DEV_MODE.value:
-                    # Show the instance in the description, plus fixups that are assigned.
-                    fixups = [
-                        f'* `{var}` = `{value}`'
-                        for var, value in corr.fixups.items()
-                    ] + [
-                        f'* `{opt.fixup}` = {opt.name}'
-                        for opt in options
-                    ]
-                    description = tkMarkdown.join(
-                        tkMarkdown.MarkdownData.text(f'{corr.instance}\n', tkMarkdown.TextTag.CODE),
-                        corr.desc,
-                        tkMarkdown.MarkdownData.text('\nFixups:\n', tkMarkdown.TextTag.BOLD),
-                        tkMarkdown.convert(TransToken.untranslated('\n'.join(fixups)), None)
-                    )
+                    try:
+                        description = self._desc_cache[id(corr)]
+                    except KeyError:
+                        # Show the instance in the description, plus fixups that are assigned.
+                        fixups = '\n'.join(itertools.chain(
+                            (f'* `{var}` = `{value}`' for var, value in corr.fixups.items()),
+                            (f'* `{opt.fixup}` = {opt.name}' for opt in options),
+                        ))
+                        description = self._desc_cache[id(corr)] = tkMarkdown.join(
+                            tkMarkdown.MarkdownData.text(f'{corr.instance}\n', tkMarkdown.TextTag.CODE),
+                            corr.desc,
+                            tkMarkdown.MarkdownData.text('\nFixups:\n', tkMarkdown.TextTag.BOLD),
+                            tkMarkdown.convert(TransToken.untranslated(fixups), None),
+                        )
                 else:
                     description = corr.desc
 
@@ -494,7 +560,7 @@ class Selector(Generic[IconT, OptionRowT]):
             self.ui_desc_set_img_state(IMG_CORR_BLANK, False, False)
             return
 
-        direction = min(1, max(-1, direction))  # Clamp
+        direction = (direction > 0) - (direction < 0)  # Clamp to -1, 0 or 1.
 
         max_ind = len(self.cur_images) - 1
         self.img_ind += direction
@@ -531,7 +597,10 @@ class Selector(Generic[IconT, OptionRowT]):
         raise NotImplementedError
 
     async def ui_win_reflow(self) -> None:
-        """Reposition everything after the window has resized."""
+        """Reposition everything after the window has resized.
+
+        This also loads the images for the icons which are visible.
+        """
         raise NotImplementedError
 
     def ui_icon_create(self) -> None:
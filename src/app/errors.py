@@ -66,6 +66,19 @@ def _collapse_excgroup(group: BaseExceptionGroup[AppError], fatal: bool) -> Iter
             yield exc
 
 
+def _contains_apperror(group: BaseExceptionGroup[BaseException]) -> bool:
+    """Check if this group contains any ``AppError``s.
+
+    Unlike ``BaseExceptionGroup.split()``, this doesn't need to construct any new groups.
+    """
+    for exc in group.exceptions:
+        if isinstance(exc, AppError):
+            return True
+        if isinstance(exc, BaseExceptionGroup) and _contains_apperror(exc):
+            return True
+    return False
+
+
 async def console_handler(title: TransToken, desc: TransToken, errors: list[AppError]) -> None:
     """Implements an error handler which logs to the console. Useful for testing code."""
     LOGGER.error(
@@ -138,6 +151,9 @@ class ErrorUI:
             self._errors.append(AppError(error))
         elif isinstance(error, AppError):
             self._errors.append(error)
+        elif not _contains_apperror(error):
+            # Nothing for us to handle, no need to split.
+            raise error
         else:
             matching, rest = error.split(AppError)
             if matching is not None:
@@ -161,7 +177,7 @@ class ErrorUI:
         if isinstance(exc_val, AppError):
             self._errors.append(exc_val)
             exc_val = None
-        elif isinstance(exc_val, BaseExceptionGroup):
+        elif isinstance(exc_val, BaseExceptionGroup) and _contains_apperror(exc_val):
             matching, rest = exc_val.split(AppError)
             # We only handle if it's all AppError. If not, re-raise it unchanged.
             if rest is None:
@@ -1,6 +1,6 @@
 """Customizable configuration for specific items or groups of them."""
 from __future__ import annotations
-from typing import Any
+from typing import Any, Dict
 from typing_extensions import Protocol
 
 from collections.abc import Awaitable, Callable, Mapping, Iterator
@@ -22,8 +22,8 @@ from config.widgets import (
     TIMER_STR_INF as TIMER_STR_INF,
 )
 from packages.widgets import (
-    CLS_TO_KIND, ConfT, ConfigGroup, ItemVariantConf, OptConfT_contra,
-    WidgetType,
+    CLS_TO_KIND, ConfT, ConfigGroup, ItemVariantConf, MultiWidget, OptConfT_contra,
+    SingleWidget, WidgetType,
     WidgetTypeWithConf,
 )
 from packages.signage import ITEM_ID as SIGNAGE_ITEM_ID
@@ -94,16 +94,25 @@ _UI_IMPL_SINGLE: dict[WidgetType, SingleCreateTask[Any]] = {}
 _UI_IMPL_MULTI: dict[WidgetType, MultiCreateTask[Any]] = {}
 
 INF = TransToken.untranslated('∞')
-TIMER_NUM_TRANS: dict[TimerNum, TransToken] = {
-    num: TransToken.untranslated('{delta:ms}').format(delta=timedelta(seconds=float(num)))
-    for num in TIMER_NUM
-}
-TIMER_NUM_TRANS[TIMER_STR_INF] = INF
+TRANS_TIMER_DELTA = TransToken.untranslated('{delta:ms}')
+
+
+class _TimerTransMap(Dict[TimerNum, TransToken]):
+    """Formats the token for each timer value only once it is first used."""
+    def __missing__(self, num: TimerNum) -> TransToken:
+        token = self[num] = TRANS_TIMER_DELTA.format(delta=timedelta(seconds=float(num)))
+        return token
+
+
+TIMER_NUM_TRANS: dict[TimerNum, TransToken] = _TimerTransMap({TIMER_STR_INF: INF})
 TRANS_COLON = TransToken.untranslated('{text}: ')
 TRANS_GROUP_HEADER = TransToken.ui('{name} ({page}/{count})')  # i18n: Header layout for Item Properties pane.
 # For the item-variant widget, we need to refresh on style changes.
 ITEM_VARIANT_LOAD: list[tuple[str, Callable[[], object]]] = []
 
+# When creating groups, yield to the event loop after this many widgets.
+YIELD_INTERVAL = 4
+
 window: SubPane | None = None
 
 
@@ -172,6 +181,18 @@ def ui_multi_no_conf(kind: WidgetType) -> Callable[[MultiCreateNoConfTask], Mult
     return deco
 
 
+async def widget_conf_task(wid: SingleWidget | MultiWidget) -> None:
+    """Apply the saved config to a widget, then store it whenever it changes.
+
+    This runs in the background, so creating the group doesn't have to wait for each widget.
+    """
+    if wid.has_values:
+        await config.APP.set_and_run_ui_callback(
+            WidgetConfig, wid.apply_conf, f'{wid.group_id}:{wid.id}',
+        )
+    await wid.state_store_task()
+
+
 async def create_group(
     master: ttk.Frame,
     nursery: trio.Nursery,
@@ -194,7 +215,8 @@ async def create_group(
             wid_frame = ttk.Frame(frame)
             wid_frame.grid(row=row, column=0, sticky='ew')
             wid_frame.columnconfigure(1, weight=1)
-            await trio.sleep(0)
+            if row % YIELD_INTERVAL == 0:
+                await trio.sleep(0)
 
             label: ttk.Label | None = None
             if s_wid.name:
@@ -232,11 +254,7 @@ async def create_group(
                     tk_tools.link_checkmark(widget, label)
             else:
                 widget.grid(row=0, column=0, columnspan=2, sticky='ew')
-            if s_wid.has_values:
-                await config.APP.set_and_run_ui_callback(
-                    WidgetConfig, s_wid.apply_conf, f'{s_wid.group_id}:{s_wid.id}',
-                )
-            nursery.start_soon(s_wid.state_store_task)
+            nursery.start_soon(widget_conf_task, s_wid)
             if s_wid.tooltip:
                 add_tooltip(widget, s_wid.tooltip)
                 if label is not None:
@@ -260,7 +278,8 @@ async def create_group(
         try:
             multi_func = _UI_IMPL_MULTI[m_wid.kind]
         except KeyError:
-            multi_func = widget_timer_generic(_UI_IMPL_SINGLE[m_wid.kind])
+            # Wrap the single version, and store so later widgets can reuse it.
+            multi_func = _UI_IMPL_MULTI[m_wid.kind] = widget_timer_generic(_UI_IMPL_SINGLE[m_wid.kind])
 
         wid_frame.grid(row=row, column=0, sticky='ew', pady=5)
         try:
@@ -275,11 +294,9 @@ async def create_group(
         except Exception:
             LOGGER.exception('Could not construct widget {}.{}', group.id, m_wid.id)
             continue
-        await config.APP.set_and_run_ui_callback(
-            WidgetConfig, m_wid.apply_conf, f'{m_wid.group_id}:{m_wid.id}',
-        )
-        nursery.start_soon(m_wid.state_store_task)
-        await trio.sleep(0)
+        nursery.start_soon(widget_conf_task, m_wid)
+        if row % YIELD_INTERVAL == 0:
+            await trio.sleep(0)
 
         if m_wid.tooltip:
             add_tooltip(wid_frame, m_wid.tooltip)
@@ -317,11 +334,13 @@ async def make_pane(
         tool_col=12,
     )
 
-    ordered_conf: list[ConfigGroup] = sorted(
-        packages.get_loaded_packages().all_obj(ConfigGroup),
-        key=lambda grp: str(grp.name),
-    )
-    ordered_conf.insert(0, STYLEVAR_GROUP)
+    # This is sorted by update_translations() below, before anything is displayed.
+    ordered_conf: list[ConfigGroup] = [
+        STYLEVAR_GROUP,
+        *packages.get_loaded_packages().all_obj(ConfigGroup),
+    ]
+    # Position of each group in the ordered list, rebuilt whenever it is resorted.
+    group_pos: dict[ConfigGroup, int] = {group: i for i, group in enumerate(ordered_conf)}
 
     selection_frame = ttk.Frame(window)
     selection_frame.grid(row=0, column=0, columnspan=2, sticky='ew')
@@ -457,35 +476,53 @@ async def make_pane(
     def select_directional(direction: int) -> None:
         """Change the selection in some direction."""
         # Clamp to ±1 since scrolling can send larger numbers.
-        pos = ordered_conf.index(cur_group) + (+1 if direction > 0 else -1)
+        pos = group_pos[cur_group] + (+1 if direction > 0 else -1)
         if 0 <= pos < len(ordered_conf):
             select_group(ordered_conf[pos])
 
     def update_disp() -> None:
         """Update widgets if the group has changed."""
+        pos = group_pos[cur_group]
         set_text(group_label, TRANS_GROUP_HEADER.format(
             name=cur_group.name,
-            page=ordered_conf.index(cur_group) + 1,
+            page=pos + 1,
             count=len(ordered_conf),
         ))
-        pos = ordered_conf.index(cur_group)
         group_var.set(cur_group.id)
         arrow_left.state(['disabled' if pos == 0 else '!disabled'])
         arrow_right.state(['disabled' if pos + 1 == len(ordered_conf) else '!disabled'])
 
     async def update_translations() -> None:
         """Update translations in the display, reordering if necessary."""
+        # Reuse the menu callbacks each time we rebuild.
+        group_commands: dict[ConfigGroup, Callable[[], None]] = {}
+        # The group currently assigned to each menu entry.
+        menu_groups: list[ConfigGroup] = []
         # Stylevar always goes at the start.
         while True:
             ordered_conf.sort(key=lambda grp: (0 if grp is STYLEVAR_GROUP else 1, str(grp.name)))
-            # Remake all the menu widgets.
-            group_menu.delete(0, 'end')
-            for group in ordered_conf:
-                group_menu.insert_radiobutton(
-                    'end', label=str(group.name),
-                    variable=group_var, value=group.id,
-                    command=functools.partial(select_group, group),
-                )
+            group_pos.clear()
+            group_pos.update({group: i for i, group in enumerate(ordered_conf)})
+            # Update the existing menu entries in place, only adding new ones the first time.
+            for i, group in enumerate(ordered_conf):
+                label = str(group.name)
+                if i < len(menu_groups) and menu_groups[i] is group:
+                    group_menu.entryconfigure(i, label=label)
+                    continue
+                try:
+                    cmd = group_commands[group]
+                except KeyError:
+                    cmd = group_commands[group] = functools.partial(select_group, group)
+                if i < len(menu_groups):
+                    group_menu.entryconfigure(i, label=label, value=group.id, command=cmd)
+                    menu_groups[i] = group
+                else:
+                    group_menu.insert_radiobutton(
+                        'end', label=label,
+                        variable=group_var, value=group.id,
+                        command=cmd,
+                    )
+                    menu_groups.append(group)
             update_disp()
             await CURRENT_LANG.wait_transition()
 
@@ -499,8 +536,24 @@ async def make_pane(
         nursery.start_soon(update_translations)
         await tk_tools.wait_eventloop()
 
-        # Update canvas when the window resizes.
-        canvas.bind('<Configure>', f'{canvas} configure -scrollregion [{canvas} bbox all]')
+        # Update canvas when the window resizes. This fires repeatedly while dragging, so only
+        # recompute the bounding box once the burst of events is handled.
+        reflow_pending = False
+
+        def canvas_reflow() -> None:
+            """Update the scroll region to fit the contents."""
+            nonlocal reflow_pending
+            reflow_pending = False
+            canvas['scrollregion'] = canvas.bbox('all')
+
+        def evt_canvas_configure(_: object) -> None:
+            """Schedule a reflow, if one isn't already pending."""
+            nonlocal reflow_pending
+            if not reflow_pending:
+                reflow_pending = True
+                canvas.after_idle(canvas_reflow)
+
+        canvas.bind('<Configure>', evt_canvas_configure)
         await display_group(cur_group)
         task_status.started()
         await trio.sleep_forever()
@@ -587,11 +640,19 @@ async def widget_item_variant(
         raise ValueError(f'Unknown item "{conf.item_id}"!') from None
 
     version_lookup: list[str] = []
+    version_names: list[str] = []
 
     def update_data() -> None:
         """Refresh the data in the list."""
-        nonlocal version_lookup
-        version_lookup = contextWin.set_version_combobox(combobox, item)
+        nonlocal version_lookup, version_names
+        new_lookup, new_names = item.get_version_names()
+        if new_lookup == version_lookup and new_names == version_names:
+            # The options are unchanged, so only the selection needs to be updated.
+            if len(version_names) > 1:
+                combobox.current(version_lookup.index(item.selected_version().id))
+            return
+        version_names = new_names
+        version_lookup = contextWin.set_version_combobox(combobox, item, (new_lookup, new_names))
 
     def change_callback(e: object = None) -> None:
         """Change the item version."""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from decimal import Decimal
+import functools
 import math
 
 import tkinter as tk
@@ -20,13 +22,14 @@ import utils
 TRANS_OFF = TransToken.ui('Off')
 
 
+@functools.lru_cache(maxsize=256)
 def decimal_points(num: float) -> int:
     """Count the number of decimal points required to display a number."""
-    str_num = format(num, 'g')
-    if '.' in str_num:
-        whole, frac = str_num.split('.')
-        return len(frac)
-    else:
+    # Formatting with 'g' switches to exponent notation for small values, so use Decimal instead.
+    exponent = Decimal(repr(num)).normalize().as_tuple().exponent
+    if isinstance(exponent, int):
+        return max(0, -exponent)
+    else:  # NaN or infinity.
         return 0
 
 
@@ -46,29 +49,27 @@ async def widget_slider(
 
     # The formatting of the text display is a little complex.
     # We want to keep the same number of decimal points for all values.
-    points = max(
-        decimal_points(conf.min + conf.step * offset)
-        for offset in range(ui_min, int(ui_max) + 1)
-    )
+    # Every value is min + step * n, so it never needs more points than those two.
+    points = max(decimal_points(conf.min), decimal_points(conf.step))
     txt_format = f'.{points}f'
     # Then we want to figure out the longest value with this format to set
-    # the widget width
+    # the widget width. The values change linearly, so that's one of the ends.
     widget_width = max(
-        len(format(conf.min + conf.step * offset, txt_format))
-        for offset in range(ui_min, int(ui_max) + 1)
+        len(format(conf.min, txt_format)),
+        len(format(conf.min + conf.step * ui_max, txt_format)),
     )
 
-    last_value = ''
+    last_pos: int | None = None
 
     def change_cmd(value: str) -> None:
         """Called when the slider is changed."""
-        nonlocal last_value
-        value_num = float(value)
-        new_pos = format(conf.min + conf.step * round(value_num), txt_format)
-        # Only trigger sounds when moving each step.
-        if last_value != new_pos:
+        nonlocal last_pos
+        pos = round(float(value))
+        # This is called repeatedly while dragging, only do anything when moving each step.
+        if pos != last_pos:
+            last_pos = pos
             itemconfig.widget_sfx()
-            last_value = holder.value = new_pos
+            holder.value = format(conf.min + conf.step * pos, txt_format)
 
     frame = ttk.Frame(parent)
     frame.columnconfigure(1, weight=1)
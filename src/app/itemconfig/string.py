@@ -12,6 +12,20 @@ from ui_tk.img import TKImages
 import utils
 
 
+# Maps Tk variable names to the holder they update. This allows all textboxes to share a single
+# trace callback, instead of each needing their own closure.
+_VAR_TO_HOLDER: dict[str, tuple[tk.StringVar, AsyncValue[str]]] = {}
+
+
+def _on_var_changed(name: str, index: str, op: str) -> None:
+    """When a textbox is changed, propagate to the holder."""
+    try:
+        var, holder = _VAR_TO_HOLDER[name]
+    except KeyError:  # Widget was removed.
+        return
+    holder.value = var.get()
+
+
 @itemconfig.ui_single_no_conf(KIND_STRING)
 async def widget_string(
     parent: tk.Widget, tk_img: TKImages,
@@ -22,14 +36,14 @@ async def widget_string(
     var = tk.StringVar(parent, holder.value)
     entry = ttk.Entry(parent, textvariable=var)
 
-    def on_changed(*args: object) -> None:
-        """When changed, propagate."""
-        holder.value = var.get()
-
-    var.trace_add('write', on_changed)
+    var_name = str(var)
+    _VAR_TO_HOLDER[var_name] = (var, holder)
+    var.trace_add('write', _on_var_changed)
 
     task_status.started(entry)
-
-    async with utils.aclosing(holder.eventual_values(held_for=0.125)) as agen:
-        async for value in agen:
-            var.set(value)
+    try:
+        async with utils.aclosing(holder.eventual_values(held_for=0.125)) as agen:
+            async for value in agen:
+                var.set(value)
+    finally:
+        del _VAR_TO_HOLDER[var_name]
@@ -1,6 +1,7 @@
 """Allows enabling and disabling specific voicelines."""
 from __future__ import annotations
 import functools
+import operator
 from decimal import Decimal
 from enum import Enum
 from typing import Iterable, TypedDict, cast
@@ -52,6 +53,8 @@ IMG: dict[LineCriteria, img.Handle] = {
 }
 
 ID_MIDCHAMBER = 'MIDCHAMBER'
+# Midchamber quotes are ordered by their untranslated name.
+_quote_sort_key = operator.attrgetter('name.token')
 # i18n: 'response' tab name, should be short.
 TRANS_RESPONSE_SHORT = TransToken.ui('Resp')
 # i18n: 'Response' tab header.
@@ -288,7 +291,7 @@ def show(tk_img: TKImages, quote_pack: QuotePack) -> None:
             config=config_mid,
             contents=(
                 (quote.name, ID_MIDCHAMBER, quote.lines)
-                for quote in sorted(quote_pack.data.midchamber, key=lambda quote: quote.name.token)
+                for quote in sorted(quote_pack.data.midchamber, key=_quote_sort_key)
             )
         )
 
@@ -22,7 +22,7 @@ from ui_tk import TK_ROOT, tk_tools
 from app import img
 from ipc_types import (
     ScreenID, StageID,
-    ARGS_SEND_LOAD, ARGS_REPLY_LOAD, ARGS_SEND_LOGGING,  ARGS_REPLY_LOGGING,
+    ARGS_LOAD_OP, ARGS_SEND_LOAD, ARGS_REPLY_LOAD, ARGS_SEND_LOGGING,  ARGS_REPLY_LOGGING,
 )
 import ipc_types
 import utils
@@ -162,9 +162,9 @@ class BaseLoadScreen:
             self.values[stage] = 0
         self.reset_stages()
 
-    def op_step(self, stage: StageID) -> None:
+    def op_step(self, stage: StageID, amount: int) -> None:
         """Increment the specified value."""
-        self.values[stage] += 1
+        self.values[stage] += amount
         self.update_stage(stage)
 
     def op_set_length(self, stage: StageID, num: int) -> None:
@@ -843,9 +843,53 @@ def run_background(
 
     log_window = LogWindow(queue_reply_log)
 
+    def handle_op(op: ARGS_LOAD_OP) -> None:
+        """Apply a single operation sent from the main process."""
+        if isinstance(op, ipc_types.Load2Daemon_Init):
+            # Create a new loadscreen.
+            screen = (SplashScreen if op.is_splash else LoadScreen)(op.scr_id, op.title, force_ontop, op.stages)
+            SCREENS[op.scr_id] = screen
+        elif isinstance(op, ipc_types.Load2Daemon_UpdateTranslations):
+            TRANSLATION.update(op.translations)
+            log_window.update_translations()
+            for screen in SCREENS.values():
+                if isinstance(screen, LoadScreen):
+                    screen.update_translations()
+        elif isinstance(op, ipc_types.Load2Daemon_SetForceOnTop):
+            for screen in SCREENS.values():
+                screen.win.attributes('-topmost', op.on_top)
+        elif isinstance(op, ipc_types.ScreenOp):
+            try:
+                screen = SCREENS[op.screen]
+            except KeyError:
+                return
+
+            if isinstance(op, ipc_types.Load2Daemon_Show):
+                screen.op_show(op.title, op.stage_names)
+            elif isinstance(op, ipc_types.Load2Daemon_Hide):
+                screen.op_hide()
+            elif isinstance(op, ipc_types.Load2Daemon_Reset):
+                screen.op_reset()
+            elif isinstance(op, ipc_types.Load2Daemon_Destroy):
+                screen.op_destroy()
+            elif isinstance(op, ipc_types.Load2Daemon_SetLength):
+                screen.op_set_length(op.stage, op.size)
+            elif isinstance(op, ipc_types.Load2Daemon_Step):
+                screen.op_step(op.stage, op.amount)
+            elif isinstance(op, ipc_types.Load2Daemon_Skip):
+                screen.op_skip_stage(op.stage)
+            elif isinstance(op, ipc_types.Load2Daemon_SetIsCompact):
+                if isinstance(screen, SplashScreen):
+                    screen.op_set_is_compact(op.compact)
+                else:
+                    print('Called set_is_compact() on regular loadscreen?')
+            else:
+                assert_never(op)
+        else:
+            assert_never(op)
+
     def check_queue() -> None:
         """Update stages from the parent process."""
-        nonlocal force_ontop
         had_values = False
         cur_time = time.monotonic()
         try:
@@ -861,48 +905,11 @@ def run_background(
                     # ensure we do run the logs too if we timeout, but if we don't share the same timeout.
                     cur_time = time.monotonic()
                     break
-                if isinstance(op, ipc_types.Load2Daemon_Init):
-                    # Create a new loadscreen.
-                    screen = (SplashScreen if op.is_splash else LoadScreen)(op.scr_id, op.title, force_ontop, op.stages)
-                    SCREENS[op.scr_id] = screen
-                elif isinstance(op, ipc_types.Load2Daemon_UpdateTranslations):
-                    TRANSLATION.update(op.translations)
-                    log_window.update_translations()
-                    for screen in SCREENS.values():
-                        if isinstance(screen, LoadScreen):
-                            screen.update_translations()
-                elif isinstance(op, ipc_types.Load2Daemon_SetForceOnTop):
-                    for screen in SCREENS.values():
-                        screen.win.attributes('-topmost', op.on_top)
-                elif isinstance(op, ipc_types.ScreenOp):
-                    try:
-                        screen = SCREENS[op.screen]
-                    except KeyError:
-                        continue
-
-                    if isinstance(op, ipc_types.Load2Daemon_Show):
-                        screen.op_show(op.title, op.stage_names)
-                    elif isinstance(op, ipc_types.Load2Daemon_Hide):
-                        screen.op_hide()
-                    elif isinstance(op, ipc_types.Load2Daemon_Reset):
-                        screen.op_reset()
-                    elif isinstance(op, ipc_types.Load2Daemon_Destroy):
-                        screen.op_destroy()
-                    elif isinstance(op, ipc_types.Load2Daemon_SetLength):
-                        screen.op_set_length(op.stage, op.size)
-                    elif isinstance(op, ipc_types.Load2Daemon_Step):
-                        screen.op_step(op.stage)
-                    elif isinstance(op, ipc_types.Load2Daemon_Skip):
-                        screen.op_skip_stage(op.stage)
-                    elif isinstance(op, ipc_types.Load2Daemon_SetIsCompact):
-                        if isinstance(screen, SplashScreen):
-                            screen.op_set_is_compact(op.compact)
-                        else:
-                            print('Called set_is_compact() on regular loadscreen?')
-                    else:
-                        assert_never(op)
+                if isinstance(op, ipc_types.Load2Daemon_Batch):
+                    for sub_op in op.ops:
+                        handle_op(sub_op)
                 else:
-                    assert_never(op)
+                    handle_op(op)
             while True:  # Pop off all the values.
                 try:
                     rec_args = queue_rec_log.get_nowait()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing_extensions import Self, override
 from collections.abc import Mapping
+import functools
 
 from srctools import EmptyMapping, Keyvalues, conv_bool, bool_as_int, logger
 from srctools.dmx import Element, ValueType as DMXValue
@@ -27,6 +28,7 @@ class Config(config.Data, conf_name='Corridor', uses_id=True, version=2):
     enabled: Mapping[str, bool] = EmptyMapping
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def get_id(
         style: str,
         mode: GameMode,
@@ -1,4 +1,4 @@
-from typing import Dict, List, Mapping, NewType, Union, cast
+from typing import Dict, Mapping, NewType, Tuple, Union, cast
 from typing_extensions import override
 
 from srctools import EmptyMapping, Keyvalues, logger
@@ -13,10 +13,10 @@ LOGGER = logger.get_logger(__name__, 'conf.widgets')
 
 # To prevent mixups, a newtype for 1-30 timer strings + 'INF'.
 TimerNum = NewType('TimerNum', str)
-TIMER_NUM: List[TimerNum] = cast(List[TimerNum], list(map(str, range(3, 31))))
+TIMER_NUM: Tuple[TimerNum, ...] = cast(Tuple[TimerNum, ...], tuple(map(str, range(3, 31))))
 TIMER_STR_INF: TimerNum = cast(TimerNum, 'inf')
-TIMER_NUM_INF: List[TimerNum] = [TIMER_STR_INF, *TIMER_NUM]
-VALID_NUMS = set(TIMER_NUM_INF)
+TIMER_NUM_INF: Tuple[TimerNum, ...] = (TIMER_STR_INF, *TIMER_NUM)
+VALID_NUMS = frozenset(TIMER_NUM_INF)
 
 
 def parse_timer(value: str) -> TimerNum:
@@ -46,8 +46,10 @@ class Load2Daemon_SetLength(StageOp):
     size: int
 
 
+@attrs.frozen
 class Load2Daemon_Step(StageOp):
-    pass
+    """Advance a stage by some number of steps."""
+    amount: int = 1
 
 
 class Load2Daemon_Skip(StageOp):
@@ -91,12 +93,21 @@ class Daemon2Load_MainSetCompact:
     compact: bool
 
 
-ARGS_SEND_LOAD = TypeAliasType("ARGS_SEND_LOAD", Union[
+ARGS_LOAD_OP = TypeAliasType("ARGS_LOAD_OP", Union[
     Load2Daemon_SetForceOnTop, Load2Daemon_SetForceOnTop,
     Load2Daemon_UpdateTranslations, Load2Daemon_SetIsCompact, Load2Daemon_Init,
     Load2Daemon_SetLength, Load2Daemon_Step, Load2Daemon_Skip, Load2Daemon_Hide,
     Load2Daemon_Reset, Load2Daemon_Destroy, Load2Daemon_Show,
 ])
+
+
+@attrs.frozen
+class Load2Daemon_Batch:
+    """Several operations sent together, to apply in order."""
+    ops: Tuple[ARGS_LOAD_OP, ...]
+
+
+ARGS_SEND_LOAD = TypeAliasType("ARGS_SEND_LOAD", Union[ARGS_LOAD_OP, Load2Daemon_Batch])
 ARGS_REPLY_LOAD = TypeAliasType("ARGS_REPLY_LOAD", Union[Daemon2Load_Cancel, Daemon2Load_MainSetCompact])
 ARGS_SEND_LOGGING = TypeAliasType("ARGS_SEND_LOGGING", Union[  # logging -> daemon
     Tuple[Literal['log'], str, str],
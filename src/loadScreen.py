@@ -8,7 +8,7 @@ The id() of the main-process object is used to identify loadscreens.
 from __future__ import annotations
 
 
-from typing import AsyncGenerator, Collection, Generator, MutableMapping, Set, List, TypeVar, Type
+from typing import AsyncGenerator, Collection, Dict, Generator, MutableMapping, Set, List, TypeVar, Type
 from typing_extensions import assert_never
 from types import TracebackType
 from weakref import WeakValueDictionary
@@ -21,7 +21,7 @@ import trio
 
 from config.gen_opts import GenOptions
 from config import APP
-from transtoken import TransToken, CURRENT_LANG
+from transtoken import Language, TransToken, CURRENT_LANG
 import ipc_types
 import utils
 
@@ -37,6 +37,8 @@ _QUEUE_SEND_LOGGING: multiprocessing.Queue[ipc_types.ARGS_SEND_LOGGING] = multip
 _QUEUE_REPLY_LOGGING: multiprocessing.Queue[ipc_types.ARGS_REPLY_LOGGING] = multiprocessing.Queue()
 
 T = TypeVar('T')
+# ScreenStage.iterate() sends at most around this many updates.
+ITERATE_UPDATES = 200
 
 
 LOGGER = srctools.logger.get_logger(__name__)
@@ -92,35 +94,55 @@ class ScreenStage:
         self._max = 0
         self._skipped = False
 
+    def _send_all(self, ops: List[ipc_types.ARGS_LOAD_OP]) -> None:
+        """Send operations for each bound screen, as a single message if possible."""
+        if len(ops) == 1:
+            _QUEUE_SEND_LOAD.put(ops[0])
+        elif ops:
+            _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_Batch(tuple(ops)))
+
     async def set_length(self, num: int) -> None:
         """Change the current length of this stage."""
         self._max = num
-        for screen in list(self._bound):
-            _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_SetLength(screen.id, self.id, num))
+        self._send_all([
+            ipc_types.Load2Daemon_SetLength(screen.id, self.id, num)
+            for screen in self._bound
+        ])
         await trio.sleep(0)
 
-    async def step(self, info: object = None) -> None:
-        """Increment one step."""
-        self._current += 1
+    async def step(self, info: object = None, amount: int = 1) -> None:
+        """Increment one or more steps."""
+        self._current += amount
         self._skipped = False
-        for screen in list(self._bound):
-            _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_Step(screen.id, self.id))
+        self._send_all([
+            ipc_types.Load2Daemon_Step(screen.id, self.id, amount)
+            for screen in self._bound
+        ])
         await trio.sleep(0)
 
     async def skip(self) -> None:
         """Skip this stage."""
         self._current = 0
         self._skipped = True
-        for screen in list(self._bound):
-            _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_Skip(screen.id, self.id))
+        self._send_all([ipc_types.Load2Daemon_Skip(screen.id, self.id) for screen in self._bound])
         await trio.sleep(0)
 
     async def iterate(self, seq: Collection[T]) -> AsyncGenerator[T, None]:
         """Tie the progress of a stage to a sequence of some kind."""
         await self.set_length(len(seq))
+        # For long sequences, only update the screen every few items.
+        chunk = max(1, len(seq) // ITERATE_UPDATES)
+        pending = 0
         for item in seq:
             yield item
-            await self.step()
+            pending += 1
+            if pending >= chunk:
+                await self.step(amount=pending)
+                pending = 0
+            else:
+                await trio.sleep(0)
+        if pending:
+            await self.step(amount=pending)
 
 
 class LoadScreen:
@@ -146,15 +168,23 @@ class LoadScreen:
         self._scope: trio.CancelScope | None = None
 
         # Order the daemon to make this screen. We pass translated text in for the splash screen.
+        title = str(title_text)
+        stage_titles = [str(stage.title) for stage in stages]
         _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_Init(
             scr_id=self.id,
             is_splash=is_splash,
-            title=str(title_text),
+            title=title,
             stages=[
-                (stage.id, str(stage.title))
-                for stage in stages
+                (stage.id, stage_title)
+                for stage, stage_title in zip(stages, stage_titles)
             ],
         ))
+        # The last show message we sent, and the language it was translated with.
+        # Showing will likely be done in the same language, so prepare that now.
+        self._show_op: tuple[Language, ipc_types.Load2Daemon_Show] | None = (
+            CURRENT_LANG.value,
+            ipc_types.Load2Daemon_Show(self.id, title, stage_titles),
+        )
         _ALL_SCREENS[self.id] = self
 
     def __enter__(self) -> LoadScreen:
@@ -210,11 +240,7 @@ class LoadScreen:
     def _show(self) -> None:
         """Display the loading screen."""
         self.active = True
-        # Translate and send these across now.
-        _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_Show(
-            self.id, str(self.title),
-            [str(stage.title) for stage in self.stages],
-        ))
+        _QUEUE_SEND_LOAD.put(self._get_show_op())
         for stage in self.stages:
             stage._bound.add(self)
 
@@ -234,19 +260,37 @@ class LoadScreen:
     def unsuppress(self) -> None:
         """Undo temporarily hiding the screen."""
         self.active = True
-        _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_Show(
+        _QUEUE_SEND_LOAD.put(self._get_show_op())
+
+    def _get_show_op(self) -> ipc_types.Load2Daemon_Show:
+        """Translate the titles to send across, reusing the last result if the language is the same."""
+        lang = CURRENT_LANG.value
+        if self._show_op is not None and self._show_op[0] is lang:
+            return self._show_op[1]
+        op = ipc_types.Load2Daemon_Show(
             self.id, str(self.title),
             [str(stage.title) for stage in self.stages],
-        ))
+        )
+        self._show_op = (lang, op)
+        return op
 
 
-async def _update_translations() -> None:
-    """Update the translations whenever the language changes."""
+def _translate_all() -> Dict[str, str]:
+    """Translate the tokens used by the subprocess."""
+    return {key: str(tok) for key, tok in TRANSLATIONS.items()}
+
+
+async def _update_translations(sent: Dict[str, str]) -> None:
+    """Update the translations whenever the language changes.
+
+    The daemon already has the translations we passed in, only send them if they actually differ.
+    """
     while True:
         await CURRENT_LANG.wait_transition()
-        _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_UpdateTranslations(
-            {key: str(tok) for key, tok in TRANSLATIONS.items()},
-        ))
+        translations = _translate_all()
+        if translations != sent:
+            _QUEUE_SEND_LOAD.put(ipc_types.Load2Daemon_UpdateTranslations(translations))
+            sent = translations
 
 
 async def _listen_to_process() -> None:
@@ -281,12 +325,13 @@ async def startup(*, task_status: trio.TaskStatus[None] = trio.TASK_STATUS_IGNOR
     _bg_started = True
 
     # Initialise the daemon.
+    translations = _translate_all()
     process = multiprocessing.Process(
         target=utils.run_bg_daemon,
         args=(
             _QUEUE_SEND_LOAD, _QUEUE_REPLY_LOAD, _QUEUE_SEND_LOGGING, _QUEUE_REPLY_LOGGING,
             # Convert and pass translation strings.
-            {key: str(tok) for key, tok in TRANSLATIONS.items()},
+            translations,
         ),
         name='bg_daemon',
         daemon=True,
@@ -295,7 +340,7 @@ async def startup(*, task_status: trio.TaskStatus[None] = trio.TASK_STATUS_IGNOR
     process.start()
     try:
         async with trio.open_nursery() as nursery:
-            nursery.start_soon(_update_translations)
+            nursery.start_soon(_update_translations, translations)
             nursery.start_soon(_listen_to_process)
             task_status.started()
     finally:
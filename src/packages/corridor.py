@@ -4,6 +4,7 @@ from typing_extensions import Final
 
 from collections import defaultdict
 from collections.abc import Sequence, Iterator, Mapping
+import functools
 import itertools
 
 from srctools import Keyvalues, logger
@@ -39,6 +40,8 @@ ICON_GENERIC_SML = img.Handle.builtin('BEE2/corr_generic', IMG_WIDTH_SML, IMG_HE
 IMG_WIDTH_LRG: Final = 256
 IMG_HEIGHT_LRG: Final = 192
 ICON_GENERIC_LRG = img.Handle.builtin('BEE2/corr_generic', IMG_WIDTH_LRG, IMG_HEIGHT_LRG)
+# Shared by all corridors without their own images.
+IMAGES_GENERIC: Final[Sequence[img.Handle]] = (ICON_GENERIC_LRG,)
 
 ALL_MODES: Final[Sequence[GameMode]] = list(GameMode)
 ALL_DIRS: Final[Sequence[Direction]] = list(Direction)
@@ -58,6 +61,13 @@ class CorridorUI(Corridor):
     images: Sequence[img.Handle]
     icon: img.Handle
     authors: Sequence[TransToken]
+    # Casefolded instance filename, used as the key in configs.
+    instance_fold: str = attrs.field(init=False, repr=False, eq=False)
+
+    @instance_fold.default
+    def _fold_instance(self) -> str:
+        """Casefold the instance once, since this is used frequently."""
+        return self.instance.casefold()
 
     def strip_ui(self) -> Corridor:
         """Strip these UI attributes for the compiler export."""
@@ -70,45 +80,45 @@ class CorridorUI(Corridor):
         )
 
 
+# Keywords accepted by parse_specifier(), including the orientation aliases.
+_DIRECTION_KEYWORDS: Final[Mapping[str, Direction]] = {direction.value: direction for direction in Direction}
+_MODE_KEYWORDS: Final[Mapping[str, GameMode]] = {mode.value: mode for mode in GameMode}
+_ORIENT_KEYWORDS: Final[Mapping[str, Orient]] = {
+    name.casefold(): orient
+    for name, orient in Orient.__members__.items()
+}
+
+
 def parse_specifier(specifier: str) -> CorrSpec:
     """Parse a string like 'sp_entry' or 'exit_coop_dn' into the 3 enums."""
     orient: Orient | None = None
     mode: GameMode | None = None
     direction: Direction | None = None
     for part in specifier.casefold().split('_'):
-        try:
-            parsed_dir = Direction(part)
-        except ValueError:
-            pass
-        else:
+        if (parsed_dir := _DIRECTION_KEYWORDS.get(part)) is not None:
             if direction is not None:
                 raise ValueError(f'Multiple entry/exit keywords in "{specifier}"!')
             direction = parsed_dir
-            continue
-        try:
-            parsed_orient = Orient[part.upper()]
-        except KeyError:
-            pass
-        else:
+        elif (parsed_orient := _ORIENT_KEYWORDS.get(part)) is not None:
             if orient is not None:
                 raise ValueError(f'Multiple orientation keywords in "{specifier}"!')
             orient = parsed_orient
-            continue
-        try:
-            parsed_mode = GameMode(part)
-        except ValueError:
-            pass
-        else:
+        elif (parsed_mode := _MODE_KEYWORDS.get(part)) is not None:
             if mode is not None:
                 raise ValueError(f'Multiple sp/coop keywords in "{specifier}"!')
             mode = parsed_mode
-            continue
         # Completely empty specifier will split into [''], allow `sp__exit` too.
-        if part:
+        elif part:
             raise ValueError(f'Unknown keyword "{part}" in "{specifier}"!')
     return mode, direction, orient
 
 
+@functools.lru_cache(maxsize=256)
+def parse_authors(authors: str) -> Sequence[TransToken]:
+    """Parse an author list. Many corridors share the same authors, so the result is shared."""
+    return tuple(map(TransToken.untranslated, packages.sep_values(authors)))
+
+
 def parse_corr_kind(specifier: str) -> CorrKind:
     """Parse a string into a specific corridor type."""
     mode, direction, orient = parse_specifier(specifier)
@@ -203,7 +213,7 @@ class CorridorGroup(packages.PakObject, allow_mult=True):
             if kv.name == 'inherit':
                 inherits.append(kv.value)
                 continue
-            images = [
+            images: Sequence[img.Handle] = [
                 img.Handle.parse(subprop, data.pak_id, IMG_WIDTH_LRG, IMG_HEIGHT_LRG)
                 for subprop in kv.find_all('Image')
             ]
@@ -214,7 +224,7 @@ class CorridorGroup(packages.PakObject, allow_mult=True):
             else:
                 icon = ICON_GENERIC_SML
             if not images:
-                images.append(ICON_GENERIC_LRG)
+                images = IMAGES_GENERIC
 
             mode, direction, orient = parse_corr_kind(kv.name)
 
@@ -237,7 +247,7 @@ class CorridorGroup(packages.PakObject, allow_mult=True):
             corridors[mode, direction, orient].append(CorridorUI(
                 instance=kv['instance'],
                 name=name,
-                authors=list(map(TransToken.untranslated, packages.sep_values(kv['authors', '']))),
+                authors=parse_authors(kv['authors', '']),
                 desc=packages.desc_parse(kv, 'Corridor', data.pak_id),
                 default_enabled=not kv.bool('disabled', False),
                 config=packages.get_config(kv, 'items', data.pak_id, source='Corridor ' + kv.name),
@@ -286,24 +296,41 @@ class CorridorGroup(packages.PakObject, allow_mult=True):
         # Need both of these to be parsed.
         await packset.ready(packages.Item).wait()
         await packset.ready(packages.Style).wait()
+        # The same styles are repeated for every item and version, so only look each up once.
+        # Each maps to the style, corridor group and authors, or None if the style doesn't exist.
+        style_info_cache: dict[str, tuple[packages.Style, CorridorGroup, Sequence[TransToken]] | None] = {}
         for item_id, (mode, direction) in ID_TO_CORR.items():
             try:
                 item = packset.obj_by_id(packages.Item, item_id)
             except KeyError:
                 continue
             count = CORRIDOR_COUNTS[mode, direction]
+            # Instances already in each group, shared between versions.
+            dup_checks: dict[str, set[str]] = {}
             for vers in item.versions.values():
                 for style_id, variant in vers.styles.items():
                     try:
-                        style = packset.obj_by_id(packages.Style, style_id)
+                        cached = style_info_cache[style_id]
                     except KeyError:
+                        try:
+                            style = packset.obj_by_id(packages.Style, style_id)
+                        except KeyError:
+                            cached = None
+                        else:
+                            try:
+                                corridor_group = packset.obj_by_id(cls, style_id)
+                            except KeyError:
+                                # Synthesise a new group to match.
+                                corridor_group = cls(id=style_id, corridors={})
+                                packset.add(corridor_group, item.pak_id, item.pak_name)
+                            cached = (
+                                style, corridor_group,
+                                tuple(map(TransToken.untranslated, style.selitem_data.auth)),
+                            )
+                        style_info_cache[style_id] = cached
+                    if cached is None:
                         continue
-                    try:
-                        corridor_group = packset.obj_by_id(cls, style_id)
-                    except KeyError:
-                        # Synthesise a new group to match.
-                        corridor_group = cls(id=style_id, corridors={})
-                        packset.add(corridor_group, item.pak_id, item.pak_name)
+                    style, corridor_group, authors = cached
 
                     corr_list = corridor_group.corridors.setdefault(
                         (mode, direction, Orient.HORIZONTAL),
@@ -311,7 +338,10 @@ class CorridorGroup(packages.PakObject, allow_mult=True):
                     )
                     # If the item has corridors defined, transfer to this.
                     had_legacy = False
-                    dup_check = {corr.instance.casefold() for corr in corr_list}
+                    try:
+                        dup_check = dup_checks[style_id]
+                    except KeyError:
+                        dup_check = dup_checks[style_id] = {corr.instance.casefold() for corr in corr_list}
                     for ind in range(count):
                         try:
                             inst = variant.editor.instances[ind]
@@ -332,9 +362,9 @@ class CorridorGroup(packages.PakObject, allow_mult=True):
                             corridor = CorridorUI(
                                 instance=fname,
                                 name=TRANS_CORRIDOR_GENERIC,
-                                images=[ICON_GENERIC_LRG],
+                                images=IMAGES_GENERIC,
                                 icon=ICON_GENERIC_SML,
-                                authors=list(map(TransToken.untranslated, style.selitem_data.auth)),
+                                authors=authors,
                                 desc=tkMarkdown.MarkdownData.BLANK,
                                 config=lazy_conf.BLANK,
                                 default_enabled=True,
@@ -351,7 +381,7 @@ class CorridorGroup(packages.PakObject, allow_mult=True):
                                 name=TRANS_CORRIDOR_GENERIC,
                                 images=[img.Handle.file(style_info.icon, IMG_WIDTH_LRG, IMG_HEIGHT_LRG)],
                                 icon=img.Handle.file(style_info.icon, IMG_WIDTH_SML, IMG_HEIGHT_SML),
-                                authors=list(map(TransToken.untranslated, style.selitem_data.auth)),
+                                authors=authors,
                                 desc=tkMarkdown.MarkdownData.text(style_info.desc),
                                 config=lazy_conf.BLANK,
                                 default_enabled=True,
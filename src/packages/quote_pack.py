@@ -1,5 +1,5 @@
 from __future__ import annotations
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from quote_pack import Line, Quote, QuoteEvent, Group, QuoteInfo, Response, Monitor, RESPONSE_NAMES
 from transtoken import AppError, TransToken, TransTokenSource
@@ -31,12 +31,7 @@ class QuotePack(PakObject, needs_foreground=True, style_suggest_key='quote'):
     async def parse(cls, data: ParseData) -> 'QuotePack':
         """Parse a voice line definition."""
         selitem_data = SelitemData.parse(data.info, data.pak_id)
-        chars = {
-            char.strip()
-            for char in
-            data.info['characters', ''].split(',')
-            if char.strip()
-        }
+        chars = set(filter(None, map(str.strip, data.info['characters', ''].split(','))))
 
         # For Cave Johnson voicelines, this indicates what skin to use on the
         # portrait.
@@ -86,41 +81,47 @@ class QuotePack(PakObject, needs_foreground=True, style_suggest_key='quote'):
         responses: dict[Response, list[Line]] = {}
         midchamber: list[Quote] = []
 
-        for group_kv in quotes_kv.find_all('Group'):
-            group = Group.parse(data.pak_id, group_kv)
-            if group.id in groups:
-                groups[group.id] += group
-            else:
-                groups[group.id] = group
-
-        with logger.context('Midchamber'):
-            for mid_kv in quotes_kv.find_all('Midchamber', 'Quote'):
-                midchamber.append(Quote.parse(data.pak_id, mid_kv, True))
-
-        for event_kv in quotes_kv.find_all('QuoteEvents', 'Event'):
-            event = QuoteEvent.parse(event_kv)
-            if event.id in events:
-                LOGGER.warning(
-                    'Duplicate QuoteEvent "{}" for quote pack {}',
-                    event.id, data.id
-                )
-            events[event.id] = event
-
         response_dings = use_dings
 
-        for resp_kv in quotes_kv.find_children('CoopResponses'):
-            try:
-                resp = RESPONSE_NAMES[resp_kv.name]
-            except KeyError:
-                raise AppError(TransToken.ui(
-                    'Invalid response kind "{name}" in config for quote pack {id}!'
-                ).format(name=resp_kv.real_name, id=data.id)) from None
-            response_dings = resp_kv.bool('use_dings', response_dings)
-
-            lines = responses.setdefault(resp, [])
-            with logger.context(repr(resp)):
-                for line_kv in resp_kv:
-                    lines.append(Line.parse(data.pak_id, line_kv, False))
+        # Go through the children once, handling each kind of block as we find it.
+        for child_kv in quotes_kv:
+            if child_kv.name == 'group':
+                group = Group.parse(data.pak_id, child_kv)
+                if group.id in groups:
+                    groups[group.id] += group
+                else:
+                    groups[group.id] = group
+            elif child_kv.name == 'midchamber':
+                if not child_kv.has_children():
+                    continue
+                with logger.context('Midchamber'):
+                    for mid_kv in child_kv.find_all('Quote'):
+                        midchamber.append(Quote.parse(data.pak_id, mid_kv, True))
+            elif child_kv.name == 'quoteevents':
+                if not child_kv.has_children():
+                    continue
+                for event_kv in child_kv.find_all('Event'):
+                    event = QuoteEvent.parse(event_kv)
+                    if event.id in events:
+                        LOGGER.warning(
+                            'Duplicate QuoteEvent "{}" for quote pack {}',
+                            event.id, data.id
+                        )
+                    events[event.id] = event
+            elif child_kv.name == 'coopresponses':
+                for resp_kv in child_kv:
+                    try:
+                        resp = RESPONSE_NAMES[resp_kv.name]
+                    except KeyError:
+                        raise AppError(TransToken.ui(
+                            'Invalid response kind "{name}" in config for quote pack {id}!'
+                        ).format(name=resp_kv.real_name, id=data.id)) from None
+                    response_dings = resp_kv.bool('use_dings', response_dings)
+
+                    lines = responses.setdefault(resp, [])
+                    with logger.context(repr(resp)):
+                        for line_kv in resp_kv:
+                            lines.append(Line.parse(data.pak_id, line_kv, False))
 
         return cls(
             data.id,
@@ -181,48 +182,50 @@ class QuotePack(PakObject, needs_foreground=True, style_suggest_key='quote'):
     @classmethod
     async def post_parse(cls, packset: PackagesSet) -> None:
         """Verify no quote packs have duplicate IDs."""
-        used: set[str] = set()
         voice: QuotePack
         for voice in packset.all_obj(cls):
             for group in voice.data.groups.values():
-                used.clear()
-                for quote in group.quotes:
-                    for line in quote.lines:
-                        if line.id in used:
-                            LOGGER.warning(
-                                'Quote Pack "{}" has duplicate line ID "{}" in group "{}"!',
-                                voice.id, line.id, group.id
-                            )
-                        used.add(line.id)
-            used.clear()
-            for quote in voice.data.midchamber:
-                for line in quote.lines:
-                    if line.id in used:
-                        LOGGER.warning(
-                            'Quote Pack "{}" has duplicate midchamber line ID "{}"',
-                            voice.id, line.id,
-                        )
-                    used.add(line.id)
-            used.clear()
-            for resp in voice.data.responses.values():
-                for line in resp:
-                    if line.id in used:
-                        LOGGER.warning(
-                            'Quote Pack "{}" has duplicate response line ID "{}"',
-                            voice.id, line.id,
-                        )
-                    used.add(line.id)
+                if dups := _duplicate_ids(line for quote in group.quotes for line in quote.lines):
+                    LOGGER.warning(
+                        'Quote Pack "{}" has duplicate line IDs in group "{}": {}',
+                        voice.id, group.id, dups,
+                    )
+            if dups := _duplicate_ids(line for quote in voice.data.midchamber for line in quote.lines):
+                LOGGER.warning(
+                    'Quote Pack "{}" has duplicate midchamber line IDs: {}',
+                    voice.id, dups,
+                )
+            if dups := _duplicate_ids(line for resp in voice.data.responses.values() for line in resp):
+                LOGGER.warning(
+                    'Quote Pack "{}" has duplicate response line IDs: {}',
+                    voice.id, dups,
+                )
 
     def iter_trans_tokens(self) -> Iterator[TransTokenSource]:
         """Yield all translation tokens in this voice pack."""
-        yield from self.selitem_data.iter_trans_tokens(f'voiceline/{self.id}')
+        prefix = f'voiceline/{self.id}'
+        yield from self.selitem_data.iter_trans_tokens(prefix)
         for group in self.data.groups.values():
-            yield group.name, f'voiceline/{self.id}/{group.id}.name'
-            yield group.desc, f'voiceline/{self.id}/{group.id}.desc'
+            group_prefix = f'{prefix}/{group.id}'
+            yield group.name, group_prefix + '.name'
+            yield group.desc, group_prefix + '.desc'
             for quote in group.quotes:
-                yield from quote.iter_trans_tokens(f'voiceline/{self.id}/{group.id}')
+                yield from quote.iter_trans_tokens(group_prefix)
+        resp_prefix = prefix + '/responses'
         for resp, lines in self.data.responses.items():
             for line in lines:
-                yield from line.iter_trans_tokens(f'voiceline/{self.id}/responses')
+                yield from line.iter_trans_tokens(resp_prefix)
         for quote in self.data.midchamber:
-            yield from quote.iter_trans_tokens(f'voiceline/{self.id}/midchamber/{quote.name.token}')
+            yield from quote.iter_trans_tokens(f'{prefix}/midchamber/{quote.name.token}')
+
+
+def _duplicate_ids(lines: Iterable[Line]) -> list[str]:
+    """Return the IDs of lines which reuse the ID of an earlier line."""
+    seen: set[str] = set()
+    dups: list[str] = []
+    for line in lines:
+        if line.id in seen:
+            dups.append(line.id)
+        else:
+            seen.add(line.id)
+    return dups
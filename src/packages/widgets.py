@@ -1,14 +1,16 @@
 """Customizable configuration for specific items or groups of them."""
 from __future__ import annotations
 from typing import (
-    Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Protocol, Set,
+    Any, Callable, Dict, Final, Generic, Iterator, List, Optional, Protocol, Set,
     Tuple, Type, TypeVar,
 )
 from typing_extensions import Self
+import functools
 import itertools
+import string
 
 from srctools import EmptyMapping, Keyvalues, Vec, logger
-from trio_util import AsyncValue, wait_any
+from trio_util import AsyncValue, RepeatedEvent
 import attrs
 import trio
 
@@ -36,26 +38,47 @@ ConfT = TypeVar('ConfT', bound=ConfigProto)  # Type of the config object for a w
 OptConfT_contra = TypeVar('OptConfT_contra', bound=Optional[ConfigProto], contravariant=True)
 LEGACY_CONFIG = BEE2_config.ConfigFile('item_cust_configs.cfg', legacy=True)
 LOGGER = logger.get_logger(__name__)
+_HEX_DIGITS: Final = frozenset(string.hexdigits)
 
 
-@attrs.frozen
+@functools.lru_cache(maxsize=4096)
+def _parse_token(pak_id: utils.SpecialID, text: str) -> TransToken:
+    """Parse a token, sharing the result between widgets with identical text.
+
+    Overrides and repeated widgets often have the same labels and tooltips. Tokens are immutable,
+    so these can be reused.
+    """
+    return TransToken.parse(pak_id, text)
+
+
+# Each kind is only created once when registered, so compare by identity. That makes these
+# cheap to use as dict keys.
+@attrs.frozen(eq=False)
 class WidgetType:
     """Information about a type of widget."""
     name: str
     is_wide: bool
 
 
-@attrs.frozen
+@attrs.frozen(eq=False)
 class WidgetTypeWithConf(WidgetType, Generic[ConfT]):
     """Information about a type of widget, that requires configuration."""
     conf_type: type[ConfT]
 
 
-# Maps widget type names to the type info.
+# Maps widget type names to the type info. Names are stored both casefolded and as originally
+# written, so lookups can usually skip casefolding.
 WIDGET_KINDS: dict[str, WidgetType] = {}
 CLS_TO_KIND: dict[type[ConfigProto], WidgetTypeWithConf[Any]] = {}
 
 
+def _add_kind(name: str, kind: WidgetType) -> None:
+    """Register a name for a widget type."""
+    folded = name.casefold()
+    assert folded not in WIDGET_KINDS, name
+    WIDGET_KINDS[folded] = WIDGET_KINDS[name] = kind
+
+
 def register(*names: str, wide: bool = False) -> Callable[[type[ConfT]], type[ConfT]]:
     """Register a widget type that takes config.
 
@@ -70,9 +93,7 @@ def register(*names: str, wide: bool = False) -> Callable[[type[ConfT]], type[Co
         assert cls not in CLS_TO_KIND, cls
         CLS_TO_KIND[cls] = kind
         for name in names:
-            name = name.casefold()
-            assert name not in WIDGET_KINDS, name
-            WIDGET_KINDS[name] = kind
+            _add_kind(name, kind)
         return cls
     return deco
 
@@ -84,9 +105,7 @@ def register_no_conf(*names: str, wide: bool = False) -> WidgetType:
     """
     kind = WidgetType(names[0], wide)
     for name in names:
-        name = name.casefold()
-        assert name not in WIDGET_KINDS, name
-        WIDGET_KINDS[name] = kind
+        _add_kind(name, kind)
     return kind
 
 
@@ -148,17 +167,23 @@ class MultiWidget(Widget):
     async def state_store_task(self) -> None:
         """Async task which stores the state in configs whenever it changes."""
         data_id = f'{self.group_id}:{self.id}'
-        while True:
-            # Wait for any to change, then store. We don't do them individually, since
-            # we don't want a store spam if they get changed all at once.
-            await wait_any(*[
-                holder.wait_transition
-                for holder in self.holders.values()
-            ])
-            config.APP.store_conf(WidgetConfig({
-                num: holder.value
-                for num, holder in self.holders.items()
-            }), data_id)
+        # Each holder updates its own entry, then we store the whole set. Multiple changes
+        # get merged into one event, so we don't spam stores if they get changed all at once.
+        values = {num: holder.value for num, holder in self.holders.items()}
+        changed = RepeatedEvent()
+
+        async def watch_task(num: TimerNum, holder: AsyncValue[str]) -> None:
+            """Update the value for this timer when it changes."""
+            async with utils.aclosing(holder.transitions()) as agen:
+                async for value, _ in agen:
+                    values[num] = value
+                    changed.set()
+
+        async with trio.open_nursery() as nursery:
+            for num, holder in self.holders.items():
+                nursery.start_soon(watch_task, num, holder)
+            async for _ in changed.events():
+                config.APP.store_conf(WidgetConfig(values.copy()), data_id)
 
 
 class ConfigGroup(packages.PakObject, allow_mult=True, needs_foreground=True):
@@ -193,14 +218,20 @@ class ConfigGroup(packages.PakObject, allow_mult=True, needs_foreground=True):
         widgets: List[SingleWidget] = []
         multi_widgets: List[MultiWidget] = []
 
+        # Bind these once, instead of looking them up for every widget.
+        get_cur_conf = config.APP.get_cur_conf
+        get_legacy_conf = LEGACY_CONFIG.get_val
+
         for wid in props.find_all('Widget'):
             await trio.sleep(0)
+            kind_name = wid['type']
             try:
-                kind = WIDGET_KINDS[wid['type'].casefold()]
+                # Usually written exactly as registered, only casefold if required.
+                kind = WIDGET_KINDS.get(kind_name) or WIDGET_KINDS[kind_name.casefold()]
             except KeyError:
                 LOGGER.warning(
                     'Unknown widget type "{}" in <{}:{}>!',
-                    wid['type'],
+                    kind_name,
                     data.pak_id,
                     data.id,
                 )
@@ -210,13 +241,13 @@ class ConfigGroup(packages.PakObject, allow_mult=True, needs_foreground=True):
             use_inf = is_timer and wid.bool('HasInf')
             wid_id = wid['id'].casefold()
             try:
-                name = TransToken.parse(data.pak_id, wid['Label'])
+                name = _parse_token(data.pak_id, wid['Label'])
             except LookupError:
                 name = TransToken.untranslated(wid_id)
-            tooltip = TransToken.parse(data.pak_id, wid['Tooltip', ''])
+            tooltip = _parse_token(data.pak_id, wid['Tooltip', ''])
             default_prop = wid.find_key('Default', '')
 
-            prev_conf = config.APP.get_cur_conf(
+            prev_conf = get_cur_conf(
                 WidgetConfig,
                 f'{data.id}:{wid_id}',
                 default=WidgetConfig(),
@@ -234,20 +265,22 @@ class ConfigGroup(packages.PakObject, allow_mult=True, needs_foreground=True):
                 wid_conf = None
 
             if is_timer:
+                timer_nums = TIMER_NUM_INF if use_inf else TIMER_NUM
+                defaults: dict[TimerNum, str] | None
                 if default_prop.has_children():
-                    defaults = {
-                        num: default_prop[num]
-                        for num in (TIMER_NUM_INF if use_inf else TIMER_NUM)
-                    }
+                    defaults = {num: default_prop[num] for num in timer_nums}
                 else:
-                    # All the same.
-                    defaults = dict.fromkeys(TIMER_NUM_INF if use_inf else TIMER_NUM, default_prop.value)
+                    # All the same, just use the value directly.
+                    defaults = None
 
                 holders: Dict[TimerNum, AsyncValue[str]] = {}
-                for num in (TIMER_NUM_INF if use_inf else TIMER_NUM):
+                for num in timer_nums:
                     if prev_conf is EmptyMapping:
                         # No new conf, check the old conf.
-                        cur_value = LEGACY_CONFIG.get_val(data.id, f'{wid_id}_{num}', defaults[num])
+                        cur_value = get_legacy_conf(
+                            data.id, f'{wid_id}_{num}',
+                            default_prop.value if defaults is None else defaults[num],
+                        )
                     elif isinstance(prev_conf, str):
                         cur_value = prev_conf
                     else:
@@ -275,7 +308,7 @@ class ConfigGroup(packages.PakObject, allow_mult=True, needs_foreground=True):
                     cur_value = ''  # Not used.
                 elif prev_conf is EmptyMapping:
                     # No new conf, check the old conf.
-                    cur_value = LEGACY_CONFIG.get_val(data.id, wid_id, default_prop.value)
+                    cur_value = get_legacy_conf(data.id, wid_id, default_prop.value)
                 elif isinstance(prev_conf, str):
                     cur_value = prev_conf
                 else:
@@ -311,7 +344,9 @@ class ConfigGroup(packages.PakObject, allow_mult=True, needs_foreground=True):
     def add_over(self, override: 'ConfigGroup') -> None:
         """Override a ConfigGroup to add additional widgets."""
         # Make sure they don't double-up.
-        conficts = self.widget_ids() & override.widget_ids()
+        conficts = self.widget_ids().intersection(
+            wid.id for wid in itertools.chain(override.widgets, override.multi_widgets)
+        )
         if conficts:
             raise ValueError('Duplicate IDs in "{}" override - {}', self.id, conficts)
 
@@ -324,20 +359,22 @@ class ConfigGroup(packages.PakObject, allow_mult=True, needs_foreground=True):
 
     def widget_ids(self) -> Set[str]:
         """Return the set of widget IDs used."""
-        widgets: List[Iterable[Widget]] = [self.widgets, self.multi_widgets]
-        return {wid.id for wid_list in widgets for wid in wid_list}
+        ids = {wid.id for wid in self.widgets}
+        ids.update(wid.id for wid in self.multi_widgets)
+        return ids
 
 
 def parse_color(color: str) -> Tuple[int, int, int]:
     """Parse a string into a color."""
+    color = color.strip()
     if color.startswith('#'):
-        try:
-            r = int(color[1:3], base=16)
-            g = int(color[3:5], base=16)
-            b = int(color[5:], base=16)
-        except ValueError:
+        # int() also accepts signs, underscores and whitespace, so check the digits first.
+        if len(color) != 7 or not _HEX_DIGITS.issuperset(color[1:]):
             LOGGER.warning('Invalid RGB value: "{}"!', color)
             r = g = b = 128
+        else:
+            value = int(color[1:], base=16)
+            r, g, b = (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
     else:
         r, g, b = map(int, Vec.from_str(color, 128, 128, 128))
     return r, g, b
@@ -12,7 +12,7 @@ from srctools import Keyvalues, Vec, parse_vec_str
 import srctools.logger
 import trio
 
-from config.widgets import WidgetConfig, TIMER_NUM_INF, parse_timer
+from config.widgets import WidgetConfig, TIMER_STR_INF, parse_timer
 from config import COMPILER
 
 
@@ -353,7 +353,7 @@ def get_itemconf(
                 if 3 <= timer_delay <= 30:
                     value = option.values[parse_timer(str(timer_delay))]
                 else:
-                    value = option.values[TIMER_NUM_INF]
+                    value = option.values[TIMER_STR_INF]
             except KeyError:
                 return default
         else:
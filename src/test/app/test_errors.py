@@ -112,6 +112,15 @@ async def test_nonfatal() -> None:
             assert reraised.value.message == "stuff"
             assert reraised.value.exceptions == (unrelated, )
 
+            # If there's no AppErrors, the group is re-raised unaltered.
+            no_errors = ExceptionGroup("unrelated", [
+                unrelated,
+                ExceptionGroup("nested", [KeyError("key")]),
+            ])
+            with pytest.raises(ExceptionGroup) as reraised:
+                error_block.add(no_errors)
+            assert reraised.value is no_errors
+
             task.append("after")
             assert error_block.result is Result.PARTIAL  # We caught the rest, not fatal.
         success = True  # The async-with did not raise.
@@ -0,0 +1,26 @@
+from typing import Tuple
+
+import pytest
+
+from packages.widgets import parse_color
+
+
+@pytest.mark.parametrize('text, color', [
+    ('#123456', (0x12, 0x34, 0x56)),
+    ('#abcDEF', (0xAB, 0xCD, 0xEF)),
+    ('#123456 ', (0x12, 0x34, 0x56)),
+    ('  #000000', (0, 0, 0)),
+    ('45 192 255', (45, 192, 255)),
+])
+def test_parse_color(text: str, color: Tuple[int, int, int]) -> None:
+    """Test parsing valid colours."""
+    assert parse_color(text) == color
+
+
+@pytest.mark.parametrize('text', [
+    '#1_2345', '# 12345', '#+12345', '#-12345',
+    '#12345', '#1234567', '#12345g', '#',
+])
+def test_parse_color_invalid(text: str) -> None:
+    """Test malformed hex colours fall back to grey."""
+    assert parse_color(text) == (128, 128, 128)
@@ -34,8 +34,8 @@ def assert_bbox(
     if bbox.tags != tags:
         pytest.fail(f'{bbox}.tags != {tags!r}{msg}')
     if (
-        bbox.min_x != x1 or bbox.min_y != y1 or bbox.min_z != z1 or
-        bbox.max_x != x2 or bbox.max_y != y2 or bbox.max_z != z2
+        (bbox.min_x, bbox.min_y, bbox.min_z, bbox.max_x, bbox.max_y, bbox.max_z)
+        != (x1, y1, z1, x2, y2, z2)
     ):
         pytest.fail(f'{bbox}.mins != ({x1} {y1} {z1}) ({x2} {y2} {z2}){msg}')
 
@@ -125,30 +125,26 @@ def test_bbox_vecs() -> None:
     assert bb.center is not bb.center
 
 
-def test_bbox_is_frozen() -> None:
+@pytest.mark.parametrize('attr, value', [
+    ('min_x', 100), ('min_y', 100), ('min_z', 100),
+    ('max_x', 100), ('max_y', 100), ('max_z', 100),
+    ('contents', CollideType.GRATE),
+    ('tags', frozenset({'tag1', 'tag2', 'tag3'})),
+])
+def test_bbox_is_frozen(attr: str, value: object) -> None:
     """Test modification is not possible."""
     bb = BBox(40, 60, 80, 120, 450, 730, contents=CollideType.PHYSICS)
     with pytest.raises(AttributeError):
-        bb.min_x = 100  # type: ignore
-    with pytest.raises(AttributeError):
-        bb.min_y = 100  # type: ignore
-    with pytest.raises(AttributeError):
-        bb.min_z = 100  # type: ignore
+        setattr(bb, attr, value)
+    # Check the assignment didn't actually do anything.
+    assert_bbox(bb, (40, 60, 80), (120, 450, 730), CollideType.PHYSICS, set())
 
-    with pytest.raises(AttributeError):
-        bb.max_x = 100  # type: ignore
-    with pytest.raises(AttributeError):
-        bb.max_y = 100  # type: ignore
-    with pytest.raises(AttributeError):
-        bb.max_z = 100  # type: ignore
 
-    with pytest.raises(AttributeError):
-        bb.contents = CollideType.GRATE  # type: ignore
-    with pytest.raises(AttributeError):
-        bb.tags = frozenset({'tag1', 'tag2', 'tag3'})  # type: ignore
+def test_bbox_tags_frozen() -> None:
+    """Test the tags set cannot be modified in-place."""
+    bb = BBox(40, 60, 80, 120, 450, 730, contents=CollideType.PHYSICS)
     with pytest.raises(AttributeError):
         bb.tags.add('extra')  # type: ignore
-    # Check all these assignments didn't actually do anything.
     assert_bbox(bb, (40, 60, 80), (120, 450, 730), CollideType.PHYSICS, set())
 
 
@@ -168,10 +164,21 @@ def test_bbox_hash() -> None:
     assert hash(bb) != hash(BBox(40, 60, 80, 120, 450, 732, contents=CollideType.PHYSICS, tags={'tag1', 'tag3'}))
 
 
+# For each axis order, the index of the source coordinate for each position.
+AXIS_INDEXES: dict[str, tuple3] = {
+    'xyz': (0, 1, 2),
+    'xzy': (0, 2, 1),
+    'yxz': (1, 0, 2),
+    'yzx': (1, 2, 0),
+    'zxy': (2, 0, 1),
+    'zyx': (2, 1, 0),
+}
+
+
 def reorder(coord: tuple3, order: str, x: int, y: int, z: int) -> Vec:
     """Reorder the coords by these axes."""
-    assoc = dict(zip('xyz', coord))
-    return Vec(x + assoc[order[0]], y + assoc[order[1]], z + assoc[order[2]])
+    i, j, k = AXIS_INDEXES[order]
+    return Vec(x + coord[i], y + coord[j], z + coord[k])
 
 
 def test_reorder_helper() -> None:
@@ -185,29 +192,31 @@ def test_reorder_helper() -> None:
 
 def get_intersect_testcases() -> Iterable[tuple[tuple3, tuple3, tuple[tuple3, tuple3] | None]]:
     """Use a VMF to make it easier to generate the bounding boxes."""
-    with Path(__file__, '../bbox_samples.vmf').open() as f:
+    with Path(__file__).with_name('bbox_samples.vmf').open() as f:
         vmf = VMF.parse(Keyvalues.parse(f))
 
+    def clamp(val: float) -> int:
+        """If one thick, make zero thick so that we can test planes."""
+        return int(math.copysign(64, val)) if abs(val) == 63 else int(val)
+
     def process(brush: Solid) -> tuple[tuple3, tuple3]:
         """Extract the bounding box from the brush."""
         bb_min, bb_max = brush.get_bbox()
-        for vec in [bb_min, bb_max]:
-            for ax in 'xyz':
-                # If one thick, make zero thick so that we can test planes.
-                if abs(vec[ax]) == 63:
-                    vec[ax] = math.copysign(64, vec[ax])
+        x1, y1, z1 = bb_min
+        x2, y2, z2 = bb_max
         return (
-            (int(bb_min.x), int(bb_min.y), int(bb_min.z)),
-            (int(bb_max.x), int(bb_max.y), int(bb_max.z)),
+            (clamp(x1), clamp(y1), clamp(z1)),
+            (clamp(x2), clamp(y2), clamp(z2)),
         )
 
     for ent in vmf.entities:
         test: Solid | None = None
         expected: Solid | None = None
         for solid in ent.solids:
-            if solid.sides[0].mat.casefold() == 'tools/toolsskip':
+            mat = solid.sides[0].mat.casefold()
+            if mat == 'tools/toolsskip':
                 expected = solid
-            if solid.sides[0].mat.casefold() == 'tools/toolstrigger':
+            elif mat == 'tools/toolstrigger':
                 test = solid
         if test is None:
             raise ValueError(ent.id)
@@ -354,7 +363,7 @@ def test_bbox_parse_plane(axis: str, mins: tuple3, maxes: tuple3) -> None:
 
 def test_volume_rotation(file_regression: FileRegressionFixture) -> None:
     """Test rotating bboxes."""
-    with Path(__file__, '../volume_sample.vmf').open() as f:
+    with Path(__file__).with_name('volume_sample.vmf').open() as f:
         vmf = VMF.parse(Keyvalues.parse(f))
 
     volumes = [
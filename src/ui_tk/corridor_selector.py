@@ -8,7 +8,7 @@ import tkinter as tk
 
 import trio
 
-from app import img, tkMarkdown
+from app import background_run, img, tkMarkdown
 from app.corridor_selector import (
     HEIGHT, IMG_ARROW_LEFT, IMG_ARROW_RIGHT, IMG_CORR_BLANK, Icon,
     OptionRow, Selector, TRANS_HELP, TRANS_NO_OPTIONS, WIDTH, TRANS_RAND_OPTION,
@@ -47,6 +47,11 @@ class IconUI(Icon):
             anchor='sw',
         )
 
+        # The canvas window this is placed in, set by place_icon().
+        self.win_id: int | None = None
+        # The image currently applied.
+        self.cur_img: img.Handle | None = None
+
         self.label.bind('<Enter>', lambda e: selector.evt_hover_enter(index))
         self.label.bind('<Leave>', lambda e: selector.evt_hover_exit())
         tk_tools.bind_leftclick(self.label, lambda e: selector.evt_selected(index))
@@ -75,7 +80,7 @@ class IconUI(Icon):
 
 def place_icon(canv: tk.Canvas, icon: IconUI, x: int, y: int, tag: str) -> None:
     """Position an icon on the canvas."""
-    canv.create_window(
+    icon.win_id = canv.create_window(
         x, y,
         width=WIDTH,
         height=HEIGHT,
@@ -144,6 +149,14 @@ class TkSelector(Selector[IconUI, OptionRowUI]):
         self.tk_img = tk_img
         self.sel_count = 0
         self.sel_handle_moving = False
+        # Mousewheel events are accumulated, then applied once Tk is idle.
+        self._wheel_accum = 0
+        self._wheel_pending = False
+        self._canv_wheel_accum = 0
+        self._canv_wheel_pending = False
+        self._visible_check_pending = False
+        # Pending after() call to handle the window being resized.
+        self._resize_job: str | None = None
 
         self.win = tk.Toplevel(TK_ROOT, name='corridor')
         self.win.withdraw()
@@ -176,7 +189,7 @@ class TkSelector(Selector[IconUI, OptionRowUI]):
         self.wid_image.grid(row=0, column=1, sticky='nsew')
         self.wid_image_right.grid(row=0, column=2, sticky='ns')
 
-        tk_tools.bind_mousewheel(self.wid_image, sel_img)
+        tk_tools.bind_mousewheel(self.wid_image, self._evt_image_wheel)
 
         tk_img.apply(self.wid_image_left, IMG_ARROW_LEFT)
         tk_img.apply(self.wid_image, IMG_CORR_BLANK)
@@ -281,21 +294,90 @@ class TkSelector(Selector[IconUI, OptionRowUI]):
 
         self.canvas = tk.Canvas(canv_frame)
         self.canvas.grid(row=0, column=0, sticky='nsew')
-        scrollbar = ttk.Scrollbar(canv_frame, orient='vertical', command=self.canvas.yview)
-        scrollbar.grid(row=0, column=1, sticky='ns')
-        self.canvas['yscrollcommand'] = scrollbar.set
+        self.scrollbar = ttk.Scrollbar(canv_frame, orient='vertical', command=self.canvas.yview)
+        self.scrollbar.grid(row=0, column=1, sticky='ns')
+        self.canvas['yscrollcommand'] = self._evt_canv_scrolled
 
-        # Avoid making self a cell var.
-        self.canvas.bind('<Configure>', tk_tools.make_handler(self.evt_resized))
+        self.canvas.bind('<Configure>', self._evt_configure)
 
         self.help_lbl = ttk.Label(self.canvas)
         set_text(self.help_lbl, TRANS_HELP)
         self.help_lbl_win = self.canvas.create_window(0, 0, anchor='nw', window=self.help_lbl)
 
-        tk_tools.add_mousewheel(self.canvas, frm_left)
+        tk_tools.bind_mousewheel(frm_left, self._evt_canvas_wheel)
         tk_tools.add_mousewheel(right_canv, frm_right)
         self.load_corridors(packset, cur_style)
 
+    def _evt_image_wheel(self, delta: int) -> None:
+        """Scroll through the preview images, coalescing rapid wheel events."""
+        self._wheel_accum += delta
+        if not self._wheel_pending:
+            self._wheel_pending = True
+            self.win.after_idle(self._flush_wheel)
+
+    def _flush_wheel(self) -> None:
+        """Apply the accumulated wheel movement to the preview image."""
+        self._wheel_pending = False
+        delta = self._wheel_accum
+        self._wheel_accum = 0
+        if delta:
+            # This clamps to a single step.
+            self._sel_img(delta)
+
+    def _evt_canvas_wheel(self, delta: int) -> None:
+        """Scroll the corridor icons, coalescing rapid wheel events."""
+        self._canv_wheel_accum += delta
+        if not self._canv_wheel_pending:
+            self._canv_wheel_pending = True
+            self.win.after_idle(self._flush_canv_wheel)
+
+    def _flush_canv_wheel(self) -> None:
+        """Apply the accumulated wheel movement to the canvas."""
+        self._canv_wheel_pending = False
+        delta = self._canv_wheel_accum
+        self._canv_wheel_accum = 0
+        if delta:
+            self.canvas.yview_scroll(delta, 'units')
+
+    def _evt_configure(self, _: tk.Event[tk.Misc]) -> None:
+        """When the canvas is resized, wait for the resizing to stop before reflowing."""
+        if self._resize_job is not None:
+            self.win.after_cancel(self._resize_job)
+        self._resize_job = self.win.after(150, self._do_resize)
+
+    def _do_resize(self) -> None:
+        """Resizing has finished, save the config and reflow."""
+        self._resize_job = None
+        background_run(self.evt_resized)
+
+    def _evt_canv_scrolled(self, first: str, last: str) -> None:
+        """When the canvas is scrolled, update the scrollbar and which icons are loaded."""
+        self.scrollbar.set(first, last)
+        if not self._visible_check_pending:
+            self._visible_check_pending = True
+            self.win.after_idle(self._update_visible_icons)
+
+    def _update_visible_icons(self) -> None:
+        """Only load images for icons which are scrolled into view, unloading the rest."""
+        self._visible_check_pending = False
+        top = self.canvas.canvasy(0)
+        if self.canvas.winfo_ismapped():
+            bottom = top + self.canvas.winfo_height()
+        else:
+            # Before the window is shown the height is 1, use the size it'll be given instead.
+            bottom = top + self.canvas.winfo_reqheight()
+        for icon, corr in zip(self.icons, self.corr_list):
+            if icon.win_id is None:
+                continue
+            coords = self.canvas.coords(icon.win_id)
+            if not coords:  # Not currently placed.
+                continue
+            y = coords[1]
+            if y + HEIGHT >= top and y <= bottom:
+                self.ui_icon_set_img(icon, corr.icon)
+            else:
+                self.ui_icon_set_img(icon, None)
+
     @override
     async def ui_task(self) -> None:
         """Task which runs to update the UI."""
@@ -320,6 +402,7 @@ class TkSelector(Selector[IconUI, OptionRowUI]):
 
         pos.place_slots(self.visible_icons(), 'icons')
         pos.resize_canvas()
+        self._update_visible_icons()
 
         # Reshape the description frame.
         right_width = self.frm_img.winfo_reqwidth()
@@ -343,6 +426,10 @@ class TkSelector(Selector[IconUI, OptionRowUI]):
         """Show the window."""
         self.win.deiconify()
         tk_tools.center_win(self.win, TK_ROOT)
+        # Now we have a real size, check which icons are visible again.
+        if not self._visible_check_pending:
+            self._visible_check_pending = True
+            self.win.after_idle(self._update_visible_icons)
 
     @override
     def ui_win_getsize(self) -> tuple[int, int]:
@@ -357,7 +444,10 @@ class TkSelector(Selector[IconUI, OptionRowUI]):
     @override
     def ui_icon_set_img(self, icon: IconUI, handle: img.Handle | None) -> None:
         """Set the image used."""
-        self.tk_img.apply(icon.label, handle)
+        # Icons are frequently cleared when already blank, skip the Tk call if so.
+        if icon.cur_img is not handle:
+            icon.cur_img = handle
+            self.tk_img.apply(icon.label, handle)
 
     @override
     def ui_enable_just_this(self, enable: bool) -> None:
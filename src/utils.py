@@ -493,6 +493,8 @@ ID_RANDOM: Final[SpecialID] = SpecialID('<RANDOM>')
 ID_EMPTY: BlankID = ''
 # Prohibit a bunch of IDs that keyvalues/dmx/etc might use for other purposes.
 PROHIBITED_IDS = {'ID', 'NAME', 'TYPE', 'VERSION'}
+# IDs may not start or end with any of these.
+_ID_BRACKETS: Final = frozenset('(<[]>)')
 
 
 def _uppercase_casefold(value: str) -> str:
@@ -506,10 +508,15 @@ def _uppercase_casefold(value: str) -> str:
 
 def obj_id_optional(value: str, kind: str = 'object') -> ObjectID | BlankID:
     """Parse an object ID, allowing through empty IDs."""
-    if (
-        value.startswith(('(', '<', '[', ']', '>', ')')) or
-        value.endswith(('(', '<', '[', ']', '>', ')'))
-    ):
+    result = _obj_id_optional(value, kind)
+    # The cache may hold an equal but different string, return the original if unchanged.
+    return ObjectID(SpecialID(value)) if result == value else result
+
+
+@functools.lru_cache(maxsize=4096)
+def _obj_id_optional(value: str, kind: str) -> ObjectID | BlankID:
+    """Validate and casefold an object ID. IDs are parsed repeatedly, so this is cached."""
+    if value and (value[0] in _ID_BRACKETS or value[-1] in _ID_BRACKETS):
         raise ValueError(f'Invalid {kind} ID "{value}". IDs may not start/end with brackets.')
     if ':' in value:
         raise ValueError(f'Invalid {kind} ID "{value}". IDs may not contain colons.')
@@ -535,7 +542,7 @@ def special_id_optional(value: str, kind: str = 'object') -> SpecialID | BlankID
     """Parse an object ID or a <special> name, allowing empty IDs."""
     if value == "":
         return ""
-    if value.startswith('<') and value.endswith('>'):
+    if value[0] == '<' and value[-1] == '>':
         # Prohibited IDs are fine here, since they're not bare.
         return SpecialID(_uppercase_casefold(value))
     # Ruled out valid combinations, any others are prohibited, it's just an ObjectID now.